@@ -0,0 +1,117 @@
+import os
+import json
+from typing import List, Dict, Optional
+
+from crawlers import CrawlUnit
+
+
+class CrawlCheckpoint:
+    """완료된 작업 단위와 수집 기사를 기록하는 append-only 저널
+
+    첫 줄은 실행 설정(config) 헤더이고, 이후 한 줄에 작업 단위 하나(JSON)를
+    기록하며 batch_size 건마다 fsync 한다. 중단된 실행은 resume=True 로 다시 열어
+    완료된 단위를 건너뛰며, 헤더의 설정이 다르면 이전 저널을 버리고 새로 시작한다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        resume: bool = False,
+        batch_size: int = 10,
+        config: Optional[Dict] = None,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        # JSON 왕복 후와 비교하므로 튜플 등을 JSON 형태로 정규화
+        self.config = json.loads(json.dumps(config or {}, ensure_ascii=False))
+        self.completed: Dict[CrawlUnit, List[Dict]] = {}
+        self._pending = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if resume and self._load():
+            self._file = open(path, "a", encoding="utf-8")
+            return
+
+        self.completed = {}
+        self._file = open(path, "w", encoding="utf-8")
+        header = {"header": self.config}
+        self._file.write(json.dumps(header, ensure_ascii=False) + "\n")
+        self._pending += 1
+        self.flush()
+
+    def _load(self) -> bool:
+        """저널에서 완료된 작업 단위 복원 (설정 불일치 또는 저널 없음이면 False)
+
+        마지막 줄이 잘린 경우 그 이후는 잘라낸다.
+        """
+        if not os.path.exists(self.path):
+            return False
+
+        valid_end = 0
+        with open(self.path, "rb") as f:
+            first = f.readline()
+            try:
+                header = json.loads(first).get("header")
+            except (json.JSONDecodeError, AttributeError):
+                header = None
+            if not first.endswith(b"\n") or header != self.config:
+                print(f"[체크포인트] 실행 설정이 달라 이전 저널을 무시합니다: {self.path}")
+                return False
+            valid_end = f.tell()
+
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                    unit = CrawlUnit(*entry["unit"])
+                    articles = entry["articles"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    break
+                self.completed[unit] = articles
+                valid_end = f.tell()
+
+        # 중단 시점에 쓰다 만 줄 이후는 버려야 이어쓰기가 깨지지 않음
+        if valid_end < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_end)
+
+        print(f"[체크포인트] {len(self.completed)}개 작업 단위 복원: {self.path}")
+        return True
+
+    def get(self, unit: CrawlUnit) -> Optional[List[Dict]]:
+        """완료된 작업 단위의 기사 목록 (미완료 시 None)"""
+        return self.completed.get(unit)
+
+    def record(self, unit: CrawlUnit, articles: List[Dict]):
+        """작업 단위 완료 기록"""
+        self.completed[unit] = articles
+        entry = {"unit": list(unit), "articles": articles}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """버퍼를 디스크에 동기화"""
+        if self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def discard(self):
+        """실행 완료 후 저널 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
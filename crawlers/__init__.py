@@ -1,2 +1,5 @@
-from .naver_news import NaverNewsCrawler
-from .google_news import GoogleNewsCrawler
+from .base import CrawlUnit, NewsSource, SOURCES, register_source, get_source
+from .naver_news import NaverNewsCrawler, NaverNewsSource
+from .google_news import GoogleNewsCrawler, GoogleNewsSource
+from .units import route, expand_units, run_unit
+from .runner import crawl_units
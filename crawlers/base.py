@@ -0,0 +1,85 @@
+import re
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional, NamedTuple, Tuple, Any, Type
+
+
+class CrawlUnit(NamedTuple):
+    """크롤링 작업 단위 (키워드 × 소스 × 언어 × 페이지)"""
+
+    keyword: str
+    source: str
+    lang: str
+    page: int
+
+    def label(self) -> str:
+        return f"{self.source}/{self.lang}/p{self.page} '{self.keyword}'"
+
+
+class NewsSource(ABC):
+    """뉴스 소스 플러그인 공통 인터페이스
+
+    서브클래스는 fetch_sync(원본 수집)와 parse(기사 추출)만 구현하고,
+    아래 클래스 속성으로 요청 제한과 지원 기능을 선언한다.
+    동시성, 체크포인트, 분산 큐는 이 선언을 보고 공통 러너가 처리한다.
+    추상 메서드를 빠뜨린 플러그인은 register_source 에서 바로 실패한다.
+    """
+
+    name: str = ""
+    host: str = ""
+    rate_limit: float = 1.0  # 같은 호스트 요청 간 최소 간격 (초)
+    paginated: bool = False  # 페이지 단위 수집 여부 (빈 페이지에서 중단)
+    incremental: bool = False  # 최신순 정렬 여부 (선언만 — 러너는 아직 사용하지 않음)
+    langs: Tuple[str, ...] = ("ko",)
+    keyword_pattern: Optional[str] = None  # 기본 라우팅 (None 이면 모든 키워드)
+
+    def accepts(self, keyword: str) -> bool:
+        """라우팅 설정이 없을 때 이 소스로 보낼 키워드인지"""
+        if self.keyword_pattern is None:
+            return True
+        return re.search(self.keyword_pattern, keyword) is not None
+
+    def units(
+        self, keyword: str, pages: int, langs: Optional[List[str]] = None
+    ) -> List[CrawlUnit]:
+        """키워드 하나를 이 소스의 작업 단위로 펼침"""
+        unknown = set(langs or []) - set(self.langs)
+        if unknown:
+            raise ValueError(f"{self.name} 소스가 지원하지 않는 언어: {sorted(unknown)}")
+        langs = [l for l in self.langs if langs is None or l in langs]
+        last_page = pages if self.paginated else 1
+        return [
+            CrawlUnit(keyword, self.name, lang, page)
+            for lang in langs
+            for page in range(1, last_page + 1)
+        ]
+
+    @abstractmethod
+    def fetch_sync(self, unit: CrawlUnit) -> Optional[Any]:
+        """원본 응답 수집 (요청 실패 시 None)"""
+
+    async def fetch(self, unit: CrawlUnit) -> Optional[Any]:
+        """비동기 수집 — 블로킹 요청은 스레드에서 실행"""
+        return await asyncio.to_thread(self.fetch_sync, unit)
+
+    @abstractmethod
+    def parse(self, raw: Any, unit: CrawlUnit) -> List[Dict]:
+        """원본 응답에서 기사 목록 추출"""
+
+
+SOURCES: Dict[str, NewsSource] = {}
+
+
+def register_source(cls: Type[NewsSource]) -> Type[NewsSource]:
+    """소스 플러그인 등록 데코레이터"""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__}.name 이 비어 있습니다.")
+    SOURCES[cls.name] = cls()
+    return cls
+
+
+def get_source(name: str) -> NewsSource:
+    try:
+        return SOURCES[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 소스: {name}") from None
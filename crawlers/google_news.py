@@ -5,6 +5,8 @@ from urllib.parse import quote_plus
 import feedparser
 from datetime import datetime
 
+from .base import NewsSource, CrawlUnit, register_source
+
 
 class GoogleNewsCrawler:
     """Google News RSS 크롤러"""
@@ -16,11 +18,16 @@ class GoogleNewsCrawler:
         self.lang = lang
         self.country = country
         self.articles = []
+        self.ok = True
 
     def crawl(self) -> List[Dict]:
         """Google News RSS 피드에서 기사 수집"""
-        self.articles = []
+        self.articles = self.parse_feed(self.fetch())
+        print(f"[구글] 총 {len(self.articles)}건 수집 완료")
+        return self.articles
 
+    def fetch(self):
+        """RSS 피드 요청 (항목 없이 bozo 이면 ok=False)"""
         url = (
             f"{self.RSS_URL}"
             f"?q={quote_plus(self.keyword)}"
@@ -33,7 +40,13 @@ class GoogleNewsCrawler:
 
         if feed.bozo:
             print(f"[구글] RSS 파싱 경고: {feed.bozo_exception}")
+        # 항목 없이 bozo 이면 네트워크/피드 오류로 간주
+        self.ok = not (feed.bozo and not feed.entries)
+        return feed
 
+    def parse_feed(self, feed) -> List[Dict]:
+        """피드 항목을 기사 목록으로 변환"""
+        articles = []
         for entry in feed.entries:
             article = {
                 "title": entry.get("title", ""),
@@ -45,10 +58,8 @@ class GoogleNewsCrawler:
                 "keyword": self.keyword,
                 "crawled_at": datetime.now().isoformat(),
             }
-            self.articles.append(article)
-
-        print(f"[구글] 총 {len(self.articles)}건 수집 완료")
-        return self.articles
+            articles.append(article)
+        return articles
 
     @staticmethod
     def _clean_html(text: str) -> str:
@@ -62,3 +73,27 @@ class GoogleNewsCrawler:
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(self.articles, f, ensure_ascii=False, indent=2)
         print(f"[구글] {filepath}에 저장 완료")
+
+
+@register_source
+class GoogleNewsSource(NewsSource):
+    """Google News RSS 소스 (모든 키워드, 한국어 + 영어)"""
+
+    name = "google"
+    host = "news.google.com"
+    rate_limit = 1.0
+    # 언어 → 검색 국가 (gl/ceid). 언어를 추가하려면 여기에 국가와 함께 선언
+    countries = {"ko": "KR", "en": "US"}
+    langs = tuple(countries)
+
+    def _crawler(self, unit: CrawlUnit) -> GoogleNewsCrawler:
+        country = self.countries[unit.lang]
+        return GoogleNewsCrawler(unit.keyword, lang=unit.lang, country=country)
+
+    def fetch_sync(self, unit: CrawlUnit):
+        google = self._crawler(unit)
+        feed = google.fetch()
+        return feed if google.ok else None
+
+    def parse(self, raw, unit: CrawlUnit) -> List[Dict]:
+        return self._crawler(unit).parse_feed(raw)
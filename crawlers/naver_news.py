@@ -6,6 +6,8 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from .base import NewsSource, CrawlUnit, register_source
+
 
 class NaverNewsCrawler:
     """네이버 뉴스 검색 크롤러"""
@@ -29,34 +31,49 @@ class NaverNewsCrawler:
         self.articles = []
 
         for page in range(1, self.max_pages + 1):
-            start = (page - 1) * 10 + 1
-            params = {
-                "where": "news",
-                "query": self.keyword,
-                "start": start,
-                "sort": 1,  # 최신순
-            }
-
-            try:
-                resp = requests.get(
-                    self.BASE_URL, params=params, headers=self.HEADERS, timeout=10
-                )
-                resp.raise_for_status()
-            except requests.RequestException as e:
-                print(f"[네이버] 페이지 {page} 요청 실패: {e}")
+            articles = self.crawl_page(page)
+            if articles is None:
                 continue
-
-            articles = self._parse_page(resp.text)
             if not articles:
                 break
 
             self.articles.extend(articles)
-            print(f"[네이버] 페이지 {page} - {len(articles)}건 수집")
             time.sleep(1)  # 서버 부하 방지
 
         print(f"[네이버] 총 {len(self.articles)}건 수집 완료")
         return self.articles
 
+    def crawl_page(self, page: int) -> Optional[List[Dict]]:
+        """검색 결과 한 페이지 크롤링 (요청 실패 시 None)"""
+        html = self.fetch_page(page)
+        if html is None:
+            return None
+
+        articles = self._parse_page(html)
+        if articles:
+            print(f"[네이버] 페이지 {page} - {len(articles)}건 수집")
+        return articles
+
+    def fetch_page(self, page: int) -> Optional[str]:
+        """검색 결과 페이지 HTML 요청 (실패 시 None)"""
+        start = (page - 1) * 10 + 1
+        params = {
+            "where": "news",
+            "query": self.keyword,
+            "start": start,
+            "sort": 1,  # 최신순
+        }
+
+        try:
+            resp = requests.get(
+                self.BASE_URL, params=params, headers=self.HEADERS, timeout=10
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            print(f"[네이버] 페이지 {page} 요청 실패: {e}")
+            return None
+        return resp.text
+
     def _parse_page(self, html: str) -> List[Dict]:
         """검색 결과 페이지 파싱"""
         soup = BeautifulSoup(html, "html.parser")
@@ -113,3 +130,22 @@ class NaverNewsCrawler:
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(self.articles, f, ensure_ascii=False, indent=2)
         print(f"[네이버] {filepath}에 저장 완료")
+
+
+@register_source
+class NaverNewsSource(NewsSource):
+    """네이버 뉴스 검색 소스 (한국어 키워드, 페이지 단위)"""
+
+    name = "naver"
+    host = "search.naver.com"
+    rate_limit = 1.0
+    paginated = True
+    incremental = True
+    langs = ("ko",)
+    keyword_pattern = "[가-힣]"
+
+    def fetch_sync(self, unit: CrawlUnit) -> Optional[str]:
+        return NaverNewsCrawler(unit.keyword).fetch_page(unit.page)
+
+    def parse(self, raw: str, unit: CrawlUnit) -> List[Dict]:
+        return NaverNewsCrawler(unit.keyword)._parse_page(raw)
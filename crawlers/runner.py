@@ -0,0 +1,82 @@
+import time
+import asyncio
+import contextlib
+from typing import List, Dict, Iterable
+
+from .base import CrawlUnit, get_source
+
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def _null_timer(name: str, cpu: bool = True):
+    return _NULL_TIMER
+
+
+class HostLimiter:
+    """호스트별 최소 요청 간격 보장 (소스의 rate_limit 선언 사용)"""
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_at: Dict[str, float] = {}
+
+    async def wait(self, host: str, interval: float):
+        lock = self._locks.get(host)
+        if lock is None:
+            lock = self._locks[host] = asyncio.Lock()
+        async with lock:
+            delay = self._next_at.get(host, 0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_at[host] = time.monotonic() + interval
+
+
+async def crawl_units(
+    units: Iterable[CrawlUnit],
+    concurrency: int = 4,
+    checkpoint=None,
+    profiler=None,
+) -> List[Dict]:
+    """작업 단위를 비동기로 실행해 기사 목록을 작업 순서대로 반환
+
+    같은 (키워드, 소스, 언어)의 페이지는 순서대로 수집해 빈 페이지에서 멈추고,
+    서로 다른 묶음은 concurrency 개까지 동시에 실행한다.
+    checkpoint 가 주어지면 완료된 단위는 건너뛰고 새로 완료된 단위는 기록한다.
+    profiler 가 주어지면 네트워크 수집(crawl/fetch)과 파싱(crawl/parse)을 따로 잰다.
+    """
+    timer = profiler.timer if profiler else _null_timer
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = HostLimiter()
+
+    chains: Dict[tuple, List[CrawlUnit]] = {}
+    for unit in units:
+        chains.setdefault((unit.keyword, unit.source, unit.lang), []).append(unit)
+
+    async def run_chain(chain: List[CrawlUnit]) -> List[Dict]:
+        results = []
+        for unit in chain:
+            source = get_source(unit.source)
+            articles = checkpoint.get(unit) if checkpoint else None
+            if articles is not None:
+                print(f"[체크포인트] {unit.label()} 건너뜀 ({len(articles)}건)")
+            else:
+                # 요청 간격 대기 중에는 동시 실행 슬롯을 잡지 않음
+                await limiter.wait(source.host, source.rate_limit)
+                async with semaphore:
+                    with timer("crawl/fetch", cpu=False):
+                        raw = await source.fetch(unit)
+                if raw is None:  # 요청 실패 — 기록하지 않고 다음 실행에서 재시도
+                    continue
+                with timer("crawl/parse"):
+                    articles = source.parse(raw, unit)
+                print(f"[{source.name}] {unit.label()} - {len(articles)}건 수집")
+                if checkpoint:
+                    checkpoint.record(unit, articles)
+
+            results.extend(articles)
+            if source.paginated and not articles:
+                break
+        return results
+
+    chain_results = await asyncio.gather(*(run_chain(c) for c in chains.values()))
+    return [a for articles in chain_results for a in articles]
@@ -0,0 +1,51 @@
+from typing import List, Dict, Optional, Iterable
+
+from .base import CrawlUnit, SOURCES, get_source
+
+
+def route(
+    keyword: str,
+    routes: Optional[Dict[str, List[str]]] = None,
+    sources: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """키워드를 보낼 소스 목록
+
+    routes 에 키워드가 있으면 그 설정을 따르고, 없으면 각 소스의
+    keyword_pattern 선언으로 결정한다. sources 로 사용할 소스를 제한할 수 있다.
+    """
+    enabled = list(sources) if sources is not None else list(SOURCES)
+    if routes and keyword in routes:
+        return [name for name in routes[keyword] if name in enabled]
+    return [name for name in enabled if get_source(name).accepts(keyword)]
+
+
+def expand_units(
+    keywords: Iterable[str],
+    pages: int,
+    langs: Optional[Dict[str, List[str]]] = None,
+    sources: Optional[Iterable[str]] = None,
+    routes: Optional[Dict[str, List[str]]] = None,
+    routing: bool = True,
+) -> List[CrawlUnit]:
+    """키워드 목록을 소스별 작업 단위로 펼침
+
+    pages 는 페이지 단위 소스에만 적용되고, langs 는 소스별 언어 제한이다.
+    routing=False 면 라우팅 없이 모든 키워드를 선택된 소스에 보낸다.
+    """
+    langs = langs or {}
+    sources = list(sources) if sources is not None else list(SOURCES)
+    units = []
+    for kw in keywords:
+        names = route(kw, routes, sources) if routing else sources
+        for name in names:
+            units.extend(get_source(name).units(kw, pages, langs.get(name)))
+    return units
+
+
+def run_unit(unit: CrawlUnit) -> Optional[List[Dict]]:
+    """작업 단위 하나를 동기 실행 (요청 실패 시 None)"""
+    source = get_source(unit.source)
+    raw = source.fetch_sync(unit)
+    if raw is None:
+        return None
+    return source.parse(raw, unit)
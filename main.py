@@ -1,12 +1,18 @@
 import os
+import sys
 import json
+import asyncio
 import argparse
+import multiprocessing
 from typing import List, Dict
 from datetime import datetime
 
 import pandas as pd
 
-from crawlers import NaverNewsCrawler, GoogleNewsCrawler
+from crawlers import SOURCES, CrawlUnit, expand_units, crawl_units
+from work_queue import WorkQueue, run_worker
+from rollups import RollupStore
+from profiling import Profiler, NULL_PROFILER, add_profile_args
 
 
 def merge_and_deduplicate(all_articles: List[Dict]) -> List[Dict]:
@@ -21,7 +27,9 @@ def merge_and_deduplicate(all_articles: List[Dict]) -> List[Dict]:
     return unique
 
 
-def save_results(articles: List[Dict], keyword: str):
+def save_results(
+    articles: List[Dict], keyword: str, profiler: Profiler = NULL_PROFILER
+):
     """결과를 JSON + CSV로 저장"""
     os.makedirs("data", exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -29,13 +37,15 @@ def save_results(articles: List[Dict], keyword: str):
 
     # JSON
     json_path = f"{base_name}.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
+    with profiler.stage("save_json"):
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(articles, f, ensure_ascii=False, indent=2)
 
     # CSV
     csv_path = f"{base_name}.csv"
-    df = pd.DataFrame(articles)
-    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    with profiler.stage("save_csv"):
+        df = pd.DataFrame(articles)
+        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
 
     print(f"\n저장 완료:")
     print(f"  JSON: {json_path}")
@@ -43,27 +53,93 @@ def save_results(articles: List[Dict], keyword: str):
     return json_path, csv_path
 
 
-def print_summary(articles: List[Dict]):
-    """수집 결과 요약 출력"""
+def print_summary(articles: List[Dict], summary: Dict):
+    """수집 결과 요약 출력 (롤업 반영 시 계산된 집계 사용)"""
     if not articles:
         print("\n수집된 기사가 없습니다.")
         return
 
-    df = pd.DataFrame(articles)
     print(f"\n{'='*60}")
     print(f"수집 결과 요약")
     print(f"{'='*60}")
-    print(f"총 기사 수: {len(articles)}건")
-    print(f"소스별: {df['source'].value_counts().to_dict()}")
+    print(f"총 기사 수: {summary['total']}건")
+    print(f"소스별: {summary['by_source']}")
     print(f"언론사별 상위 5:")
-    for press, count in df["press"].value_counts().head(5).items():
+    for press, count in summary["top_press"].items():
         print(f"  - {press}: {count}건")
     print(f"\n최근 기사 5건:")
-    for i, row in df.head(5).iterrows():
-        print(f"  [{row['press']}] {row['title']}")
+    for a in articles[:5]:
+        print(f"  [{a['press']}] {a['title']}")
     print(f"{'='*60}")
 
 
+def crawl_distributed(
+    units: List[CrawlUnit], queue_path: str, workers: int
+) -> List[Dict]:
+    """작업 큐에 단위를 적재하고 워커 프로세스로 병렬 크롤링"""
+    queue = WorkQueue.create(queue_path, units)
+    print(f"[코디네이터] {len(units)}개 작업 단위 적재 → 워커 {workers}개 ({queue_path})")
+
+    procs = [
+        multiprocessing.Process(target=run_worker, args=(queue_path,))
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    # 다른 호스트에서 참여한 워커의 리스가 남아 있을 수 있음
+    queue.wait_until_done()
+    if queue.failed():
+        print(f"[코디네이터] 실패한 작업 단위 {queue.failed()}개")
+    articles = queue.results()
+    queue.close()
+    return articles
+
+
+def run_crawl(args, profiler: Profiler):
+    """크롤링 → 중복 제거 → 요약 → 저장 파이프라인"""
+    keywords = args.keyword
+    print(f"키워드: {keywords} 뉴스 수집 시작\n")
+
+    # -l 옵션은 다국어 소스(현재 Google News)의 언어만 제한
+    langs = ["ko", "en"] if args.lang == "both" else [args.lang]
+    units = expand_units(
+        keywords,
+        pages=args.pages,
+        langs={name: langs for name, src in SOURCES.items() if len(src.langs) > 1},
+        sources=list(SOURCES) if args.source == "all" else [args.source],
+        routing=False,
+    )
+
+    with profiler.stage("crawl"):
+        if args.workers > 0:
+            all_articles = crawl_distributed(units, args.queue, args.workers)
+        else:
+            all_articles = asyncio.run(
+                crawl_units(units, concurrency=args.concurrency, profiler=profiler)
+            )
+
+    # 중복 제거
+    with profiler.stage("dedup"):
+        articles = merge_and_deduplicate(all_articles)
+    print(f"\n중복 제거 후: {len(articles)}건")
+
+    # 롤업 반영 + 요약 출력
+    with profiler.stage("rollup"):
+        rollups = RollupStore()
+        run_id = "main_" + datetime.now().strftime("%Y%m%d_%H%M%S")
+        summary = rollups.add(articles, run_id=run_id)
+        rollups.close()
+    print_summary(articles, summary)
+
+    # 저장
+    if articles:
+        label = "_".join(keywords)
+        save_results(articles, label, profiler)
+
+
 def main():
     parser = argparse.ArgumentParser(description="다리마티 뉴스 크롤러")
     parser.add_argument(
@@ -79,7 +155,7 @@ def main():
     parser.add_argument(
         "-s",
         "--source",
-        choices=["all", "naver", "google"],
+        choices=["all"] + list(SOURCES),
         default="all",
         help="크롤링 소스 (기본: all)",
     )
@@ -90,41 +166,47 @@ def main():
         default="both",
         help="Google News 언어 설정 (기본: both)",
     )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="동시 요청 묶음 수 (호스트별 요청 간격은 소스 설정 유지, 기본: 4)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=0,
+        help="분산 모드 워커 프로세스 수 (기본: 0, 단일 프로세스)",
+    )
+    parser.add_argument(
+        "--queue",
+        default="data/queue.db",
+        help="분산 모드 작업 큐 경로 (여러 호스트가 공유 가능, 기본: data/queue.db)",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="워커로만 실행 (다른 호스트의 코디네이터가 만든 --queue 에 참여)",
+    )
+    add_profile_args(parser)
     args = parser.parse_args()
 
-    keywords = args.keyword
-    print(f"키워드: {keywords} 뉴스 수집 시작\n")
-    all_articles = []
-
-    for kw in keywords:
-        print(f"\n--- 키워드: '{kw}' ---")
-        if args.source in ("all", "naver"):
-            naver = NaverNewsCrawler(kw, max_pages=args.pages)
-            all_articles.extend(naver.crawl())
-
-        if args.source in ("all", "google"):
-            lang_settings = []
-            if args.lang in ("ko", "both"):
-                lang_settings.append(("ko", "KR"))
-            if args.lang in ("en", "both"):
-                lang_settings.append(("en", "US"))
-
-            for lang, country in lang_settings:
-                print(f"  [Google {lang.upper()}]")
-                google = GoogleNewsCrawler(kw, lang=lang, country=country)
-                all_articles.extend(google.crawl())
-
-    # 중복 제거
-    articles = merge_and_deduplicate(all_articles)
-    print(f"\n중복 제거 후: {len(articles)}건")
-
-    # 요약 출력
-    print_summary(articles)
+    if args.worker:
+        try:
+            run_worker(args.queue)
+        except FileNotFoundError as e:
+            print(f"[오류] {e}")
+            sys.exit(1)
+        return
 
-    # 저장
-    if articles:
-        label = "_".join(keywords)
-        save_results(articles, label)
+    profiler = Profiler("main", mode=args.profile, memory=args.profile_memory)
+    profiler.start()
+    try:
+        run_crawl(args, profiler)
+    finally:
+        profiler.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+import os
+import sys
+import json
+import time
+import threading
+import contextlib
+from typing import List, Dict, Optional
+from datetime import datetime
+from collections import Counter
+
+# 비활성화 시 모든 stage() 가 공유하는 빈 컨텍스트
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class _Sampler(threading.Thread):
+    """모든 스레드 스택을 주기적으로 샘플링 (flamegraph collapsed 포맷용)
+
+    스택은 "단계;스레드;프레임..." 형태로 기록해 네트워크 대기 스레드
+    (예: asyncio.to_thread 실행기)와 메인 스레드의 파싱을 구분할 수 있게 한다.
+    """
+
+    def __init__(self, profiler: "Profiler", interval: float):
+        super().__init__(daemon=True, name="profiler-sampler")
+        self.profiler = profiler
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            stage = self.profiler.current_stage or "-"
+            for ident, frame in sys._current_frames().items():
+                if ident == self.ident:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                frames.append(names.get(ident, f"thread-{ident}"))
+                frames.append(stage)
+                self.stacks[";".join(reversed(frames))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class Profiler:
+    """파이프라인 단계별 프로파일러 (--profile)
+
+    mode 는 "cprofile"(결정적) 또는 "sample"(저오버헤드 샘플링),
+    memory=True 면 tracemalloc 으로 단계별 peak 메모리를 기록한다.
+    mode 와 memory 가 모두 꺼져 있으면 stage() 는 빈 컨텍스트만 반환한다.
+
+    start() 이후 생성된 스레드(asyncio.to_thread 실행기 등)도 프로파일에 포함된다.
+    그 이전부터 있던 스레드와 다른 프로세스(-w 워커)는 포함되지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: Optional[str] = None,
+        memory: bool = False,
+        out_dir: str = "reports",
+        interval: float = 0.005,
+    ):
+        self.name = name
+        self.mode = mode
+        self.memory = memory
+        self.out_dir = out_dir
+        self.interval = interval
+        self.enabled = bool(mode or memory)
+        self.current_stage: Optional[str] = None
+        self.stages: List[Dict] = []
+        self.timers: Dict[str, Dict] = {}
+        self._cprofile = None
+        self._thread_profiles: List = []
+        self._sampler = None
+        self._timer_lock = threading.Lock()
+
+    def start(self):
+        if not self.enabled:
+            return
+        if self.memory:
+            import tracemalloc
+
+            tracemalloc.start()
+        if self.mode == "cprofile":
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+            # 3.12+ 의 cProfile 은 sys.monitoring 으로 모든 스레드를 이미 관측한다
+            if sys.version_info < (3, 12):
+                threading.setprofile(self._profile_new_thread)
+        elif self.mode == "sample":
+            self._sampler = _Sampler(self, self.interval)
+            self._sampler.start()
+
+    def _profile_new_thread(self, frame, event, arg):
+        """새 스레드의 첫 이벤트에서 스레드 전용 cProfile 을 켬"""
+        import cProfile
+
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        with self._timer_lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def stage(self, name: str):
+        """단계 하나를 감싸는 컨텍스트 매니저"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._stage(name)
+
+    @contextlib.contextmanager
+    def _stage(self, name: str):
+        if self.memory:
+            import tracemalloc
+
+            tracemalloc.reset_peak()
+        parent, self.current_stage = self.current_stage, name
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                "stage": name,
+                "wall_sec": round(time.perf_counter() - wall, 4),
+                "cpu_sec": round(time.process_time() - cpu, 4),
+            }
+            if self.memory:
+                record["peak_mem_mb"] = round(
+                    tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2
+                )
+            self.stages.append(record)
+            self.current_stage = parent
+
+    def timer(self, name: str, cpu: bool = True):
+        """단계 안의 하위 구간 누적 측정 (동시 실행 구간도 합산)
+
+        cpu=True 면 현재 스레드의 CPU 시간도 잰다. await 를 감싸는 구간은
+        다른 코루틴의 CPU 가 섞이므로 cpu=False 로 wall 만 잰다.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._timer(name, cpu)
+
+    @contextlib.contextmanager
+    def _timer(self, name: str, cpu: bool):
+        wall, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.accumulate(
+                name,
+                time.perf_counter() - wall,
+                time.thread_time() - cpu_start if cpu else None,
+            )
+
+    def accumulate(self, name: str, wall: float, cpu: Optional[float] = None):
+        """하위 구간 측정값 합산 (스레드에서 호출해도 됨)"""
+        with self._timer_lock:
+            t = self.timers.setdefault(
+                name, {"wall_sec": 0.0, "cpu_sec": None, "calls": 0}
+            )
+            t["wall_sec"] += wall
+            t["calls"] += 1
+            if cpu is not None:
+                t["cpu_sec"] = (t["cpu_sec"] or 0.0) + cpu
+
+    def stop(self) -> List[str]:
+        """프로파일링 종료 후 reports/ 에 결과 저장"""
+        if not self.enabled:
+            return []
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.out_dir, f"profile_{self.name}_{timestamp}")
+        paths = []
+
+        if self._cprofile:
+            import pstats
+
+            threading.setprofile(None)
+            self._cprofile.disable()
+            stats = pstats.Stats(self._cprofile)
+            for profile in self._thread_profiles:
+                profile.disable()
+                stats.add(profile)
+            stats.dump_stats(f"{base}.prof")
+            paths.append(f"{base}.prof")
+
+        if self._sampler:
+            self._sampler.stop()
+            with open(f"{base}.folded", "w", encoding="utf-8") as f:
+                for stack, count in self._sampler.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            paths.append(f"{base}.folded")
+
+        if self.memory:
+            import tracemalloc
+
+            tracemalloc.stop()
+
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "name": self.name,
+                    "mode": self.mode,
+                    "stages": self.stages,
+                    "substages": {
+                        name: _rounded(t) for name, t in self.timers.items()
+                    },
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        paths.append(f"{base}.json")
+
+        self.print_summary()
+        print(f"[프로파일] 저장: {', '.join(paths)}")
+        return paths
+
+    def print_summary(self):
+        print(f"\n{'='*60}")
+        print(f"단계별 프로파일 ({self.mode or 'memory'})")
+        print(f"{'='*60}")
+        for s in self.stages:
+            line = (
+                f"  {s['stage']:<14} wall {s['wall_sec']:>8.3f}s"
+                f"  cpu {s['cpu_sec']:>8.3f}s"
+            )
+            if "peak_mem_mb" in s:
+                line += f"  peak {s['peak_mem_mb']:>8.2f}MB"
+            print(line)
+        for name, t in self.timers.items():
+            cpu = f"{t['cpu_sec']:>8.3f}s" if t["cpu_sec"] is not None else f"{'-':>9}"
+            print(
+                f"  └ {name:<12} wall {t['wall_sec']:>8.3f}s  cpu {cpu}"
+                f"  ({t['calls']}회 합계)"
+            )
+        print(f"{'='*60}")
+
+
+def _rounded(timer: Dict) -> Dict:
+    return {k: round(v, 4) if isinstance(v, float) else v for k, v in timer.items()}
+
+
+# 프로파일러를 받지 않은 호출부용 기본값 (항상 비활성)
+NULL_PROFILER = Profiler("null")
+
+
+def add_profile_args(parser):
+    """CLI 공통 --profile 옵션 추가"""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=["cprofile", "sample"],
+        help="단계별 프로파일링 (cprofile: .prof, sample: flamegraph .folded) → reports/",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="tracemalloc 으로 단계별 peak 메모리 기록",
+    )
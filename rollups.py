@@ -0,0 +1,154 @@
+import os
+import sqlite3
+from typing import Dict, Iterable, Optional
+from datetime import datetime
+from collections import Counter
+
+
+RELEVANT_TERMS = ["darimati", "br-001", "br001", "다리마티"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollups (
+    period TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    press TEXT NOT NULL,
+    relevant INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (period, bucket, source, keyword, press, relevant)
+);
+CREATE TABLE IF NOT EXISTS rollup_seen (
+    period TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (period, bucket, title)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY
+);
+"""
+
+
+def is_relevant(article: Dict) -> bool:
+    """DARIMATI 직접 관련 기사인지 판별"""
+    text = (article.get("title", "") + " " + article.get("description", "")).lower()
+    return any(term in text for term in RELEVANT_TERMS)
+
+
+def day_bucket(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%d")
+
+
+def week_bucket(dt: datetime) -> str:
+    """ISO 주차 (예: 2026-W08)"""
+    year, week, _ = dt.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _crawled_at(article: Dict) -> datetime:
+    try:
+        return datetime.fromisoformat(article.get("crawled_at", ""))
+    except ValueError:
+        return datetime.now()
+
+
+class RollupStore:
+    """일/주/실행 단위 기사 집계 테이블 (source, keyword, press, relevant)
+
+    기사를 저장할 때마다 해당 일/주 버킷의 카운트를 증분 갱신한다.
+    같은 버킷 안에서는 제목 기준으로 한 번만 집계하므로 재실행해도 중복되지 않는다.
+    run_id 를 주면 그 실행만의 "run" 버킷에도 집계하며, 리포트는 이 버킷을 읽어
+    다른 실행(예: main.py 수동 크롤링)의 기사가 섞이지 않게 한다.
+    """
+
+    def __init__(self, path: str = "data/rollups.db"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.executescript(SCHEMA)
+
+    def add(self, articles: Iterable[Dict], run_id: Optional[str] = None) -> Dict:
+        """기사를 롤업에 반영하고, 이번 배치의 집계를 반환"""
+        batch = Counter()
+        with self.conn:
+            if run_id:
+                # 기사가 0건인 실행도 이전 실행 비교 대상이 되도록 기록
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO runs (run_id) VALUES (?)", (run_id,)
+                )
+            for a in articles:
+                key = (a["source"], a["keyword"], a["press"], int(is_relevant(a)))
+                batch[key] += 1
+
+                crawled_at = _crawled_at(a)
+                buckets = [
+                    ("day", day_bucket(crawled_at)),
+                    ("week", week_bucket(crawled_at)),
+                ]
+                if run_id:
+                    buckets.append(("run", run_id))
+                for period, bucket in buckets:
+                    cur = self.conn.execute(
+                        "INSERT OR IGNORE INTO rollup_seen (period, bucket, title) "
+                        "VALUES (?, ?, ?)",
+                        (period, bucket, a["title"].strip()),
+                    )
+                    if cur.rowcount == 0:
+                        continue
+                    self.conn.execute(
+                        "INSERT INTO rollups "
+                        "(period, bucket, source, keyword, press, relevant, count) "
+                        "VALUES (?, ?, ?, ?, ?, ?, 1) "
+                        "ON CONFLICT (period, bucket, source, keyword, press, relevant) "
+                        "DO UPDATE SET count = count + 1",
+                        (period, bucket) + key,
+                    )
+
+        return _summarize((key + (count,) for key, count in batch.items()))
+
+    def summary(self, period: str, bucket: str) -> Dict:
+        """버킷 하나의 집계"""
+        return _summarize(
+            self.conn.execute(
+                "SELECT source, keyword, press, relevant, count FROM rollups "
+                "WHERE period = ? AND bucket = ?",
+                (period, bucket),
+            )
+        )
+
+    def run(self, run_id: str) -> Dict:
+        """실행 하나의 집계"""
+        return self.summary("run", run_id)
+
+    def previous_run(self, run_id: str, prefix: str) -> Optional[str]:
+        """run_id 이전의 같은 종류(prefix) 실행 중 가장 최근 run_id"""
+        row = self.conn.execute(
+            "SELECT MAX(run_id) FROM runs WHERE run_id >= ? AND run_id < ?",
+            (prefix, run_id),
+        ).fetchone()
+        return row[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def _summarize(rows) -> Dict:
+    """(source, keyword, press, relevant, count) 행을 리포트용 집계로 변환"""
+    total = relevant = 0
+    by_source, by_keyword, by_press = Counter(), Counter(), Counter()
+    for source, keyword, press, is_rel, count in rows:
+        total += count
+        relevant += count if is_rel else 0
+        by_source[source] += count
+        by_keyword[keyword] += count
+        by_press[press] += count
+
+    return {
+        "total": total,
+        "relevant": relevant,
+        "noise": total - relevant,
+        "by_source": dict(by_source),
+        "by_keyword": dict(by_keyword),
+        "top_press": dict(by_press.most_common(5)),
+    }
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from crawlers import CrawlUnit, SOURCES
+from work_queue import WorkQueue
+
+LEASE = 0.05
+
+
+def naver(page):
+    return CrawlUnit("다리마티", "naver", "ko", page)
+
+
+def article(title):
+    return {"title": title}
+
+
+@pytest.fixture
+def no_rate_limit(monkeypatch):
+    """호스트 요청 간격 없이 바로 claim (리스 동작만 검증)"""
+    for source in SOURCES.values():
+        monkeypatch.setattr(source, "rate_limit", 0.0)
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    queues = []
+
+    def make(units, **kwargs):
+        kwargs.setdefault("lease_seconds", LEASE)
+        queue = WorkQueue.create(str(tmp_path / "queue.db"), units, **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.close()
+
+
+def expire_leases():
+    time.sleep(LEASE * 2)
+
+
+def test_expired_lease_is_reclaimed(make_queue, no_rate_limit):
+    queue = make_queue([naver(1)])
+    unit_id, unit = queue.claim("w1")
+    assert unit == naver(1)
+    assert queue.claim("w2") is None  # 리스 유효 — 다른 워커는 못 가져감
+
+    expire_leases()
+    assert queue.claim("w2") == (unit_id, unit)
+    assert queue.complete(unit_id, "w2", [article("a")])
+    assert queue.remaining() == 0
+
+
+def test_late_complete_is_rejected(make_queue, no_rate_limit):
+    queue = make_queue([naver(1)])
+    unit_id, _ = queue.claim("w1")
+    expire_leases()
+    queue.claim("w2")
+
+    assert not queue.complete(unit_id, "w1", [article("stale")])
+    assert not queue.release(unit_id, "w1")
+    assert queue.complete(unit_id, "w2", [article("fresh")])
+    assert queue.results() == [article("fresh")]
+
+
+def test_expired_leases_fail_after_max_attempts(make_queue, no_rate_limit):
+    queue = make_queue([naver(1)], max_attempts=2)
+    queue.claim("w1")
+    expire_leases()
+    assert queue.claim("w2") is not None  # 재claim — 시도 1회
+    expire_leases()
+
+    assert queue.claim("w3") is None
+    assert queue.failed() == 1
+    assert queue.remaining() == 0
+
+
+def test_released_unit_fails_after_max_attempts(make_queue, no_rate_limit):
+    queue = make_queue([naver(1)], max_attempts=2)
+    unit_id, _ = queue.claim("w1")
+    assert queue.release(unit_id, "w1")
+    assert queue.failed() == 0
+
+    unit_id, _ = queue.claim("w1")
+    assert queue.release(unit_id, "w1")
+    assert queue.failed() == 1
+    assert queue.claim("w1") is None
+
+
+def test_skip_after_empty_page(make_queue, no_rate_limit):
+    queue = make_queue([naver(1), naver(2), naver(3)])
+    first, _ = queue.claim("w1")
+    second, unit = queue.claim("w1")
+    queue.complete(first, "w1", [article("a")])
+    queue.complete(second, "w1", [])
+    queue.skip_after(unit)
+
+    assert queue.remaining() == 0
+    assert queue.claim("w1") is None
+    assert queue.results() == [article("a")]
+
+
+def test_results_exclude_pages_after_empty_page(make_queue, no_rate_limit):
+    queue = make_queue([naver(1), naver(2), naver(3)])
+    claimed = [queue.claim("w1") for _ in range(3)]
+    pages = {unit.page: unit_id for unit_id, unit in claimed}
+
+    # 2페이지가 비어 있는 동안 3페이지가 동시에 수집된 경우
+    queue.complete(pages[1], "w1", [article("a")])
+    queue.complete(pages[3], "w1", [article("c")])
+    queue.complete(pages[2], "w1", [])
+
+    assert queue.results() == [article("a")]
+
+
+def test_claim_prefers_ready_host(make_queue):
+    google = CrawlUnit("darimati", "google", "en", 1)
+    queue = make_queue([naver(1), naver(2), google])
+
+    assert queue.claim("w1")[1] == naver(1)
+    assert queue.claim("w1")[1] == google  # naver 호스트는 요청 간격 대기 중
+    assert queue.claim("w1") is None
+    assert 0 < queue.ready_in() <= SOURCES["naver"].rate_limit
@@ -5,14 +5,17 @@
 사용법:
     python weekly_report.py
     python weekly_report.py --dry-run   # Slack 발송 없이 테스트
+    python weekly_report.py --resume    # 중단된 크롤링 이어서 실행
+    python weekly_report.py --profile   # 단계별 프로파일 → reports/
 """
 import os
 import sys
 import json
+import asyncio
 import argparse
 from typing import List, Dict, Tuple
 from datetime import datetime
-from collections import Counter
+from itertools import islice
 
 import pandas as pd
 
@@ -23,7 +26,10 @@ try:
 except ImportError:
     pass
 
-from crawlers import NaverNewsCrawler, GoogleNewsCrawler
+from crawlers import expand_units, crawl_units
+from checkpoint import CrawlCheckpoint
+from rollups import RollupStore, is_relevant, week_bucket
+from profiling import Profiler, NULL_PROFILER, add_profile_args
 from slack_notifier import SlackNotifier
 
 
@@ -36,29 +42,54 @@ KEYWORDS = [
     "darimati",
 ]
 
-GOOGLE_LANGS = [("ko", "KR"), ("en", "US")]
+GOOGLE_LANGS = ["ko", "en"]  # 국가는 GoogleNewsSource.countries 에서 결정
 NAVER_PAGES = 3
-
-
-def crawl_all() -> Tuple[List[Dict], int]:
-    """모든 키워드 + 소스로 크롤링 실행"""
-    all_articles = []
-
-    for kw in KEYWORDS:
-        # Naver (한국어 키워드만)
-        if any(ord(c) >= 0xAC00 for c in kw):  # 한글 포함 여부
-            naver = NaverNewsCrawler(kw, max_pages=NAVER_PAGES)
-            all_articles.extend(naver.crawl())
-
-        # Google News (한국어 + 영어)
-        for lang, country in GOOGLE_LANGS:
-            google = GoogleNewsCrawler(kw, lang=lang, country=country)
-            all_articles.extend(google.crawl())
+CONCURRENCY = 4
+
+# 키워드별 소스 지정 (없는 키워드는 각 소스의 기본 규칙: 네이버는 한글 키워드만)
+# 예: {"DARIMATI": ["google"], "다리마티": ["naver", "google"]}
+SOURCE_ROUTES: Dict[str, List[str]] = {}
+CHECKPOINT_PATH = "data/weekly_checkpoint.jsonl"
+RUN_PREFIX = "weekly_"  # 롤업 실행 버킷 이름 (주간 리포트 실행끼리만 비교)
+
+
+def crawl_all(
+    checkpoint: CrawlCheckpoint = None,
+    profiler: Profiler = NULL_PROFILER,
+) -> Tuple[List[Dict], int]:
+    """모든 키워드 + 소스로 크롤링 실행 (체크포인트에 완료 단위 기록)"""
+    units = expand_units(
+        KEYWORDS,
+        pages=NAVER_PAGES,
+        langs={"google": GOOGLE_LANGS},
+        routes=SOURCE_ROUTES,
+    )
+    all_articles = asyncio.run(
+        crawl_units(
+            units,
+            concurrency=CONCURRENCY,
+            checkpoint=checkpoint,
+            profiler=profiler,
+        )
+    )
+    if checkpoint:
+        checkpoint.flush()
 
     total = len(all_articles)
     return all_articles, total
 
 
+def checkpoint_config() -> Dict:
+    """체크포인트 헤더에 기록할 실행 식별 정보 (주차 + 검색 설정)"""
+    return {
+        "week": week_bucket(datetime.now()),
+        "keywords": KEYWORDS,
+        "sources": SOURCE_ROUTES,
+        "google_langs": GOOGLE_LANGS,
+        "naver_pages": NAVER_PAGES,
+    }
+
+
 def deduplicate(articles: List[Dict]) -> List[Dict]:
     """제목 기준 중복 제거"""
     seen = set()
@@ -71,39 +102,15 @@ def deduplicate(articles: List[Dict]) -> List[Dict]:
     return unique
 
 
-def is_relevant(article: Dict) -> bool:
-    """DARIMATI 직접 관련 기사인지 판별"""
-    text = (article.get("title", "") + " " + article.get("description", "")).lower()
-    relevant_terms = ["darimati", "br-001", "br001", "다리마티"]
-    return any(term in text for term in relevant_terms)
-
-
-def analyze(articles: List[Dict]) -> Dict:
-    """수집 데이터 분석"""
-    df = pd.DataFrame(articles) if articles else pd.DataFrame()
+def analyze(articles: List[Dict], rollups: RollupStore, run_id: str) -> Dict:
+    """이번 실행의 롤업 기반 분석 (원본 기사 재집계 없음)"""
+    analysis = rollups.run(run_id)
 
-    relevant = [a for a in articles if is_relevant(a)]
-    noise = [a for a in articles if not is_relevant(a)]
-
-    # 소스별 카운트
-    by_source = dict(Counter(a["source"] for a in articles)) if articles else {}
-
-    # 키워드별 카운트
-    by_keyword = dict(Counter(a["keyword"] for a in articles)) if articles else {}
-
-    # 언론사별 카운트 (상위 5)
-    press_counts = Counter(a["press"] for a in articles)
-    top_press = dict(press_counts.most_common(5))
-
-    return {
-        "total": len(articles),
-        "relevant": len(relevant),
-        "noise": len(noise),
-        "relevant_articles": relevant,
-        "by_source": by_source,
-        "by_keyword": by_keyword,
-        "top_press": top_press,
-    }
+    # Slack 주요 기사용 상위 5건만 추출
+    analysis["relevant_articles"] = list(
+        islice((a for a in articles if is_relevant(a)), 5)
+    )
+    return analysis
 
 
 def generate_insights(analysis: Dict, prev_analysis: Dict = None) -> List[str]:
@@ -173,7 +180,9 @@ def generate_next_steps(analysis: Dict) -> List[str]:
     return steps
 
 
-def save_weekly_data(articles: List[Dict], analysis: Dict):
+def save_weekly_data(
+    articles: List[Dict], analysis: Dict, profiler: Profiler = NULL_PROFILER
+):
     """주간 데이터 저장"""
     os.makedirs("data", exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -181,12 +190,14 @@ def save_weekly_data(articles: List[Dict], analysis: Dict):
     # 기사 데이터
     if articles:
         json_path = f"data/weekly_{timestamp}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        with profiler.stage("save_json"):
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(articles, f, ensure_ascii=False, indent=2)
 
         csv_path = f"data/weekly_{timestamp}.csv"
-        df = pd.DataFrame(articles)
-        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        with profiler.stage("save_csv"):
+            df = pd.DataFrame(articles)
+            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
 
     # 분석 요약 (Slack 발송 로그)
     os.makedirs("reports", exist_ok=True)
@@ -207,8 +218,13 @@ def save_weekly_data(articles: List[Dict], analysis: Dict):
     return summary_path
 
 
-def load_previous_analysis() -> Dict:
-    """가장 최근 주간 분석 데이터 로드"""
+def load_previous_analysis(rollups: RollupStore = None, run_id: str = None) -> Dict:
+    """지난 주간 실행 분석 데이터 로드 (롤업 우선, 없으면 최근 리포트 파일)"""
+    if rollups and run_id:
+        prev_run = rollups.previous_run(run_id, prefix=RUN_PREFIX)
+        if prev_run:
+            return rollups.run(prev_run)
+
     reports_dir = "reports"
     if not os.path.exists(reports_dir):
         return {}
@@ -228,38 +244,46 @@ def load_previous_analysis() -> Dict:
         return {}
 
 
-def main():
-    parser = argparse.ArgumentParser(description="DARIMATI 주간 자동 리포트")
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Slack 발송 없이 크롤링 + 분석만 실행",
-    )
-    args = parser.parse_args()
-
+def run_report(args, profiler: Profiler):
+    """크롤링 → 분석 → 저장 → Slack 발송 파이프라인"""
     print(f"\n{'='*60}")
     print(f"DARIMATI 주간 리포트 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     print(f"{'='*60}\n")
 
+    run_id = RUN_PREFIX + datetime.now().strftime("%Y%m%d_%H%M%S")
+    rollups = RollupStore()
+
     # 1. 크롤링
     print("[Step 1] 크롤링 시작...")
-    all_articles, total_raw = crawl_all()
-    articles = deduplicate(all_articles)
+    checkpoint = CrawlCheckpoint(
+        CHECKPOINT_PATH, resume=args.resume, config=checkpoint_config()
+    )
+    try:
+        with profiler.stage("crawl"):
+            all_articles, total_raw = crawl_all(checkpoint, profiler)
+    finally:
+        checkpoint.close()
+    with profiler.stage("dedup"):
+        articles = deduplicate(all_articles)
     print(f"  원본 {total_raw}건 → 중복 제거 후 {len(articles)}건\n")
 
     # 2. 분석
     print("[Step 2] 분석 중...")
-    prev_analysis = load_previous_analysis()
-    analysis = analyze(articles)
-    insights = generate_insights(analysis, prev_analysis)
-    next_steps = generate_next_steps(analysis)
+    with profiler.stage("analyze"):
+        rollups.add(articles, run_id=run_id)
+        prev_analysis = load_previous_analysis(rollups, run_id)
+        analysis = analyze(articles, rollups, run_id)
+        rollups.close()
+        insights = generate_insights(analysis, prev_analysis)
+        next_steps = generate_next_steps(analysis)
 
     print(f"  관련 기사: {analysis['relevant']}건 / 노이즈: {analysis['noise']}건")
     print(f"  인사이트 {len(insights)}건, 액션 아이템 {len(next_steps)}건\n")
 
     # 3. 저장
     print("[Step 3] 데이터 저장...")
-    save_weekly_data(articles, analysis)
+    save_weekly_data(articles, analysis, profiler)
+    checkpoint.discard()  # 결과 저장 완료 → 저널 불필요
 
     # 4. 콘솔 출력
     print(f"\n{'='*60}")
@@ -284,12 +308,13 @@ def main():
             "by_source": ", ".join(f"{k}: {v}건" for k, v in analysis["by_source"].items()),
             "keywords": ", ".join(KEYWORDS),
         }
-        success = notifier.send_weekly_report(
-            crawl_stats=crawl_stats,
-            top_articles=analysis["relevant_articles"][:5],
-            insights=insights,
-            next_steps=next_steps,
-        )
+        with profiler.stage("slack"):
+            success = notifier.send_weekly_report(
+                crawl_stats=crawl_stats,
+                top_articles=analysis["relevant_articles"][:5],
+                insights=insights,
+                next_steps=next_steps,
+            )
         if success:
             print("[완료] Slack 리포트 발송 성공!")
         else:
@@ -301,5 +326,28 @@ def main():
         sys.exit(1)
 
 
+def main():
+    parser = argparse.ArgumentParser(description="DARIMATI 주간 자동 리포트")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Slack 발송 없이 크롤링 + 분석만 실행",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="중단된 이전 실행의 체크포인트에서 크롤링 재개",
+    )
+    add_profile_args(parser)
+    args = parser.parse_args()
+
+    profiler = Profiler("weekly", mode=args.profile, memory=args.profile_memory)
+    profiler.start()
+    try:
+        run_report(args, profiler)
+    finally:
+        profiler.stop()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,306 @@
+import os
+import json
+import time
+import socket
+import sqlite3
+from typing import List, Dict, Optional, Iterable, Tuple
+
+from crawlers import CrawlUnit, get_source, run_unit
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    source TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    articles TEXT,
+    UNIQUE (keyword, source, lang, page)
+);
+CREATE TABLE IF NOT EXISTS hosts (
+    host TEXT PRIMARY KEY,
+    next_at REAL NOT NULL
+);
+"""
+
+
+class WorkQueue:
+    """SQLite 기반 로컬 작업 큐 (리스 방식으로 작업 단위 배분)
+
+    여러 프로세스/호스트가 같은 DB 파일을 공유해 작업 단위를 claim 하고,
+    리스가 만료된 단위는 다른 워커가 다시 가져간다.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 120, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 네트워크 공유 디렉토리에서도 동작하도록 WAL 대신 기본 저널 모드 사용
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def create(cls, path: str, units: Iterable[CrawlUnit], **kwargs) -> "WorkQueue":
+        """기존 큐를 비우고 작업 단위로 새 큐 구성 (코디네이터용)
+
+        다른 호스트의 워커가 파일을 열고 있을 수 있으므로 파일을 지우지 않고
+        트랜잭션 안에서 테이블만 초기화한다.
+        """
+        queue = cls(path, **kwargs)
+        with queue._transaction():
+            queue.conn.execute("DELETE FROM units")
+            queue.conn.execute("DELETE FROM hosts")
+            queue.conn.executemany(
+                "INSERT OR IGNORE INTO units (keyword, source, lang, page) "
+                "VALUES (?, ?, ?, ?)",
+                [tuple(u) for u in units],
+            )
+        return queue
+
+    @classmethod
+    def open(cls, path: str, wait_timeout: float = 60, poll: float = 1.0, **kwargs):
+        """코디네이터가 만든 기존 큐에 연결 (워커용)
+
+        파일이 없거나 작업 단위가 적재되지 않은 채 wait_timeout 이 지나면
+        FileNotFoundError 를 낸다 (경로 오타로 빈 큐가 생기지 않도록).
+        """
+        deadline = time.time() + wait_timeout
+        while True:
+            if os.path.exists(path):
+                queue = cls(path, **kwargs)
+                if queue.total():
+                    return queue
+                queue.close()
+            if time.time() >= deadline:
+                raise FileNotFoundError(
+                    f"작업 큐를 찾을 수 없습니다: {path} "
+                    f"({wait_timeout:g}초 대기, 코디네이터 실행 여부를 확인하세요)"
+                )
+            time.sleep(poll)
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+    def claim(self, worker_id: str) -> Optional[Tuple[int, CrawlUnit]]:
+        """요청 간격이 지난 호스트의 작업 단위 하나를 claim
+
+        claim 과 같은 트랜잭션에서 호스트의 다음 요청 슬롯(소스의 rate_limit)을
+        예약하므로, 리스를 받은 워커는 기다리지 않고 바로 요청한다.
+        만료된 리스를 다시 가져가는 것도 시도 1회로 센다 (워커가 죽은 경우).
+        준비된 단위가 없으면 None (대기 시간은 ready_in()).
+        """
+        now = time.time()
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE units SET status = 'failed', lease_owner = NULL "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts + 1 >= ?",
+                (now, self.max_attempts),
+            )
+            next_at = dict(self.conn.execute("SELECT host, next_at FROM hosts"))
+            for source_name, unit_id in self._claimable(now):
+                source = get_source(source_name)
+                if next_at.get(source.host, 0) <= now:
+                    break
+            else:
+                return None
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO hosts (host, next_at) VALUES (?, ?)",
+                (source.host, now + source.rate_limit),
+            )
+            self.conn.execute(
+                "UPDATE units SET "
+                "attempts = attempts + (CASE WHEN status = 'leased' THEN 1 ELSE 0 END), "
+                "status = 'leased', lease_owner = ?, lease_expires = ? "
+                "WHERE id = ?",
+                (worker_id, now + self.lease_seconds, unit_id),
+            )
+            row = self.conn.execute(
+                "SELECT keyword, source, lang, page FROM units WHERE id = ?", (unit_id,)
+            ).fetchone()
+        return unit_id, CrawlUnit(*row)
+
+    def _claimable(self, now: float) -> List[Tuple[str, int]]:
+        """claim 가능한 단위가 있는 소스별 (소스, 가장 앞선 id), 작업 순서대로"""
+        return self.conn.execute(
+            "SELECT source, MIN(id) FROM units "
+            "WHERE status = 'pending' "
+            "   OR (status = 'leased' AND lease_expires < ?) "
+            "GROUP BY source ORDER BY MIN(id)",
+            (now,),
+        ).fetchall()
+
+    def ready_in(self) -> Optional[float]:
+        """claim 가능한 단위의 호스트 슬롯이 열릴 때까지 남은 시간 (초)
+
+        claim 가능한 단위가 없으면 (다른 워커가 모두 리스 중) None.
+        """
+        now = time.time()
+        next_at = dict(self.conn.execute("SELECT host, next_at FROM hosts"))
+        waits = [
+            next_at.get(get_source(source).host, 0) - now
+            for source, _ in self._claimable(now)
+        ]
+        return max(0.0, min(waits)) if waits else None
+
+    def complete(self, unit_id: int, worker_id: str, articles: List[Dict]) -> bool:
+        """작업 단위 완료 및 결과 저장 (리스를 잃었으면 False)"""
+        with self._transaction():
+            cur = self.conn.execute(
+                "UPDATE units SET status = 'done', lease_owner = NULL, articles = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (json.dumps(articles, ensure_ascii=False), unit_id, worker_id),
+            )
+        return cur.rowcount > 0
+
+    def release(self, unit_id: int, worker_id: str) -> bool:
+        """실패한 작업 단위 반환 (max_attempts 초과 시 failed 처리)"""
+        with self._transaction():
+            cur = self.conn.execute(
+                "UPDATE units SET attempts = attempts + 1, lease_owner = NULL, "
+                "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END "
+                "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (self.max_attempts, unit_id, worker_id),
+            )
+        return cur.rowcount > 0
+
+    def skip_after(self, unit: CrawlUnit):
+        """빈 페이지 이후의 대기 중인 페이지를 빈 결과로 완료 처리"""
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE units SET status = 'done', articles = '[]' "
+                "WHERE keyword = ? AND source = ? AND lang = ? AND page > ? "
+                "AND status = 'pending'",
+                (unit.keyword, unit.source, unit.lang, unit.page),
+            )
+
+    def total(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM units").fetchone()[0]
+
+    def remaining(self) -> int:
+        """아직 완료되지 않은 작업 단위 수"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM units WHERE status IN ('pending', 'leased')"
+        ).fetchone()[0]
+
+    def failed(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM units WHERE status = 'failed'"
+        ).fetchone()[0]
+
+    def results(self) -> List[Dict]:
+        """완료된 작업 단위의 기사를 작업 순서대로 병합
+
+        순차 크롤링과 같도록, 빈 페이지 이후에 동시에 수집된 페이지는 제외한다.
+        """
+        articles = []
+        exhausted = set()
+        rows = self.conn.execute(
+            "SELECT keyword, source, lang, articles FROM units "
+            "WHERE status = 'done' ORDER BY id"
+        )
+        for keyword, source, lang, payload in rows:
+            if (keyword, source, lang) in exhausted:
+                continue
+            batch = json.loads(payload)
+            if not batch:
+                exhausted.add((keyword, source, lang))
+            articles.extend(batch)
+        return articles
+
+    def live_leases(self) -> int:
+        """리스가 아직 유효한 작업 단위 수 (살아 있는 워커가 처리 중)"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM units WHERE status = 'leased' AND lease_expires >= ?",
+            (time.time(),),
+        ).fetchone()[0]
+
+    def abandon(self) -> int:
+        """남은 작업 단위를 failed 처리 (처리할 워커가 없을 때)"""
+        with self._transaction():
+            cur = self.conn.execute(
+                "UPDATE units SET status = 'failed', lease_owner = NULL "
+                "WHERE status IN ('pending', 'leased')"
+            )
+        return cur.rowcount
+
+    def wait_until_done(self, poll: float = 2.0):
+        """다른 호스트의 워커까지 모두 끝날 때까지 대기
+
+        로컬 워커가 모두 종료된 뒤 호출한다. 두 번 연속 확인해도 유효한 리스가
+        없으면 남은 단위를 처리할 워커가 없다고 보고 failed 처리한다.
+        """
+        idle_polls = 0
+        while self.remaining():
+            idle_polls = 0 if self.live_leases() else idle_polls + 1
+            if idle_polls >= 2:
+                print(f"[코디네이터] 처리할 워커가 없어 {self.abandon()}개 작업 단위 중단")
+                return
+            time.sleep(poll)
+
+    def close(self):
+        self.conn.close()
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE 트랜잭션 (프로세스 간 쓰기 잠금)"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def run_worker(queue_path: str, poll: float = 2.0, wait_timeout: float = 60):
+    """작업 큐에서 단위를 claim 해 실행하는 워커 루프
+
+    큐가 아직 없거나 비어 있으면 wait_timeout 초까지 코디네이터를 기다린다.
+    """
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    queue = WorkQueue.open(queue_path, wait_timeout=wait_timeout)
+    done = 0
+
+    try:
+        while True:
+            claimed = queue.claim(worker_id)
+            if claimed is None:
+                if not queue.remaining():
+                    break
+                delay = queue.ready_in()
+                # 호스트 슬롯이 열릴 때까지, 또는 다른 워커의 리스 만료까지 대기
+                time.sleep(poll if delay is None else min(delay, poll))
+                continue
+
+            unit_id, unit = claimed
+            source = get_source(unit.source)
+
+            try:
+                articles = run_unit(unit)
+            except Exception as e:
+                print(f"[워커 {worker_id}] {unit.label()} 실행 오류: {e}")
+                articles = None
+            if articles is None:
+                queue.release(unit_id, worker_id)
+                continue
+
+            if not queue.complete(unit_id, worker_id, articles):
+                print(f"[워커 {worker_id}] {unit.label()} 리스 만료 — 결과 폐기")
+                continue
+            done += 1
+            if source.paginated and not articles:
+                queue.skip_after(unit)
+    finally:
+        queue.close()
+
+    print(f"[워커 {worker_id}] {done}개 작업 단위 완료")